@@ -2,34 +2,88 @@
 without the need for Verifika's UI or various dialogues.
 In turn, this speeds up the process."""
 
-from os import mkdir, remove, system
-from os.path import isfile, isdir, split
-from shutil import rmtree, copy
+from os import fsync, getpid, link, mkdir, remove, rename, replace, rmdir, scandir
+from os import stat as os_stat
+from os.path import abspath, basename, dirname, isfile, isdir, join
+from shutil import rmtree, copyfile, copyfileobj
 from tkinter import PhotoImage, TclError, Tk, Toplevel, Button, Checkbutton, StringVar, BooleanVar, Label
 from tkinter.messagebox import showinfo, showerror, askyesno
 from tkinter.filedialog import askopenfilename, askopenfilenames, asksaveasfilename
 from tkinter.ttk import Radiobutton
 from configparser import ConfigParser
-from subprocess import Popen, DEVNULL, STDOUT
+from stat import S_ISREG
+from io import StringIO
+from atexit import register
+from subprocess import Popen, run, DEVNULL
+from ctypes import Structure, byref, c_long, c_size_t, c_ulong, c_void_p, c_wchar, sizeof
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from threading import Lock, Thread
+from zipfile import ZipFile, ZIP_DEFLATED
+from xml.etree import ElementTree
+from xml.etree.ElementTree import iterparse
+from xml.sax.saxutils import unescape
+from typing import Callable, Optional
+import posixpath
+import re
 import sys
-from psutil import process_iter, NoSuchProcess
-from openpyxl import load_workbook
-from PIL import Image
-from alive_progress import alive_bar
 
+# parts of the report's XLSX package that are edited when removing sheets
+_WORKBOOK_PART = "xl/workbook.xml"
+_WORKBOOK_RELS_PART = "xl/_rels/workbook.xml.rels"
+_CONTENT_TYPES_PART = "[Content_Types].xml"
+# formula cache which refers to sheets by position, Excel rebuilds it if missing
+_CALC_CHAIN_PART = "xl/calcChain.xml"
 
-def create_program_mainloop(transparent_icon_location='images/icon.ico') -> Tk:
-    """Creates an instance of tk.Tk class and replaces its icon with a transparent one."""
+_SPREADSHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_RELATIONSHIPS_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+
+# Windows process creation flag, prevents console windows for child processes
+_CREATE_NO_WINDOW = 0x08000000
+
+# process snapshot flag and error value used by CreateToolhelp32Snapshot
+_TH32CS_SNAPPROCESS = 0x00000002
+_INVALID_HANDLE_VALUE = c_void_p(-1).value
+
+# temp_dir is renamed to this prefix followed by the PID before it is deleted in the background
+_PENDING_DELETE_PREFIX = ".pending_delete_"
+
+# name, relationship ID, and part path of a sheet in the report's XLSX package
+ReportSheet = tuple[str, str, str]
 
-    if not isfile(transparent_icon_location):
-        transparent_icon = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-        transparent_icon.save(transparent_icon_location, "ICO")
+# sheets which Verifika can report on their own, mapped to their report type
+_REPORT_PRESETS = {
+    "Common Errors": "Common",
+    "Consistency Errors": "Consistency",
+    "Spelling Errors": "Spelling",
+}
+
+# labels and return values for report type radiobuttons
+_REPORT_TYPES = (
+    ("Full Report", "Full"),
+    ("Consistency Report", "Consistency Errors"),
+    ("Spelling + Grammar Report", "Spelling + Grammar"),
+    ("Custom Report", "Custom"),
+)
+
+# labels for custom report checkbuttons
+_CHECK_LABELS = ("Common Errors", "Consistency Errors", "Spelling Errors",
+                 "Grammar Errors", "User-Defined Errors")
+
+
+def create_program_mainloop(transparent_icon_location='images/icon.ico') -> Tk:
+    """Creates an instance of tk.Tk class and replaces its icon with a transparent one.
+    The icon ships with the program, if it is missing the default icon is kept."""
 
     root = Tk()
     root.title("")
     # hides its window
     root.withdraw()
-    root.iconbitmap(True, transparent_icon_location)
+
+    try:
+        root.iconbitmap(True, transparent_icon_location)
+    except TclError:
+        pass
 
     return root
 
@@ -42,40 +96,122 @@ class ConfigFile(ConfigParser):
     def __init__(self, path):
         ConfigParser.__init__(self)
         self.path = path
-        self.read(self.path)
+        # tracks changes that have not been written to disk yet
+        self.dirty = False
+
+        # single stat that is reused by create_config
+        try:
+            self.existed = S_ISREG(os_stat(self.path).st_mode)
+        except OSError:
+            self.existed = False
+
+        # a missing file has nothing to read
+        if self.existed:
+            self.read(self.path)
+
+    def save(self):
+        """Writes the config to disk in a single write.
+        It is written to a temporary file first which then replaces the config,
+        so an interrupted write cannot leave a corrupted config behind."""
+
+        buffer = StringIO()
+        self.write(buffer)
+
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            file.write(buffer.getvalue())
+            file.flush()
+            fsync(file.fileno())
+
+        replace(temp_path, self.path)
+
+    def flush(self):
+        """Writes the config to disk, but only if it has changed since the last write."""
+
+        if not self.dirty:
+            return
+
+        self.save()
+        self.dirty = False
+
+
+# config files already created during this session, keyed by their absolute path
+_config_files: dict[str, ConfigFile] = {}
+_config_files_lock = Lock()
 
 
 def create_config(config_location='config.ini') -> ConfigFile:
     """Creates a simple config file which will keep the following:
     verifika__location: location of the Verifika executable,
-    verifika_profiles_location: location of a directory containing Verifika profiles"""
+    verifika_profiles_location: location of a directory containing Verifika profiles\n
+    Repeated calls for the same file return the same ConfigFile,
+    so it is read only once and all changes are written from one place."""
+
+    config_path = abspath(config_location)
+
+    with _config_files_lock:
+        if config_path not in _config_files:
+            _config_files[config_path] = _create_config(config_path)
+
+        return _config_files[config_path]
+
+
+def _create_config(config_location: str) -> ConfigFile:
+    """Reads the config file, or creates an empty one if it does not exist yet."""
 
     config_file = ConfigFile(config_location)
-    config_file.read(config_location)
 
-    if not isfile(config_location):
-        with open(config_location, "w", encoding="utf-8") as file:
-            config_file.write(file)
+    if not config_file.existed:
+        config_file.save()
+
+    # all changes made during the session are written once, on exit
+    register(config_file.flush)
 
     return config_file
 
 
 def update_config(config_file: ConfigFile, section: str, option: str,
                   value: str):
-    """General update function which can be used for future features."""
+    """General update function which can be used for future features.
+    Changes are kept in memory until ConfigFile.flush is called."""
+
+    # sections other than DEFAULT have to be added before their options are set,
+    # a new section has no values to compare with
+    if (section != config_file.default_section
+            and not config_file.has_section(section)):
+        # an empty value in a new section changes nothing
+        if not value:
+            return
+
+        config_file.add_section(section)
+
+    # nothing to write if the value has not changed
+    elif config_file.get(section, option, fallback=None) == value:
+        return
 
     config_file.set(section, option, value)
-    with open(config_file.path, "w", encoding="utf-8") as file:
-        config_file.write(file)
+    config_file.dirty = True
 
 
 class ToggleButton(Button):
     """"Button class that changes its image based on whether it is on or off.
     Additionally it can return its current state (on or off)."""
 
+    # images are loaded once and shared by every toggle button
+    _images: Optional[tuple[PhotoImage, PhotoImage]] = None
+
+    @classmethod
+    def _load_images(cls) -> tuple[PhotoImage, PhotoImage]:
+        """Loads on and off images the first time they are needed."""
+
+        if cls._images is None:
+            cls._images = (PhotoImage(file="images/enabled.png"),
+                           PhotoImage(file="images/disabled.png"))
+
+        return cls._images
+
     def __init__(self, master):
-        self.on_image = PhotoImage(file="images/enabled.png")
-        self.off_image = PhotoImage(file="images/disabled.png")
+        self.on_image, self.off_image = self._load_images()
         self.manual_optimization = False
 
         Button.__init__(self, master, image=self.off_image, bd=0)
@@ -121,17 +257,9 @@ def select_report_type(root: Tk) -> tuple[list[str], bool]:
 
     str_var = StringVar(radiobutton_popup, "1")
 
-    # dictionary containing labels and return values for radiobuttons
-    radiobutton_dictionary = {
-        "Full Report": "Full",
-        "Consistency Report": "Consistency Errors",
-        "Spelling + Grammar Report": "Spelling + Grammar",
-        "Custom Report": "Custom"
-    }
-
     # iterating over labels and adding buttons to the window
     row_number = 2
-    for (text, value) in radiobutton_dictionary.items():
+    for (text, value) in _REPORT_TYPES:
         radiobutton = Radiobutton(radiobutton_popup,
                                   text=text,
                                   variable=str_var,
@@ -170,14 +298,16 @@ def select_report_type(root: Tk) -> tuple[list[str], bool]:
 
 
 class CheckBox(Checkbutton):
-    """Custom tk.Checkbutton class that stores labels of checked buttons"""
+    """Custom tk.Checkbutton class that stores labels of checked buttons.
+    Each button adds itself to the boxes list of the window it belongs to."""
 
-    # Storage for all buttons
-    boxes: list[Checkbutton] = []
-
-    def __init__(self, master=None, **options):
+    def __init__(self,
+                 master=None,
+                 boxes: Optional[list["CheckBox"]] = None,
+                 **options):
         Checkbutton.__init__(self, master, options)
-        self.boxes.append(self)
+        if boxes is not None:
+            boxes.append(self)
         # var used to store checkbox state (on/off)
         self.var = BooleanVar()
         # allows the storage of its label
@@ -189,12 +319,6 @@ class CheckBox(Checkbutton):
 def checkbuttons_window(root: Tk) -> list[str]:
     """Supports custom reports via checkbuttons"""
 
-    # list containing labels for checkbuttons
-    checkbutton_list = [
-        "Common Errors", "Consistency Errors", "Spelling Errors",
-        "Grammar Errors", "User-Defined Errors"
-    ]
-
     checkbox_popup = Toplevel(root)
     checkbox_popup.attributes("-topmost", "true")
     checkbox_popup.geometry("250x265")
@@ -202,29 +326,34 @@ def checkbuttons_window(root: Tk) -> list[str]:
                   text="\nPlease select types of errors to include:\n")
     label.pack()
 
+    # storage for this window's buttons only
+    boxes: list[CheckBox] = []
+
     # iterates over values and adds buttons to the window
-    for button_label in checkbutton_list:
-        button = CheckBox(checkbox_popup, text=button_label)
+    for button_label in _CHECK_LABELS:
+        button = CheckBox(checkbox_popup, boxes=boxes, text=button_label)
         button.pack(pady=3)
 
     def check_all():
-        for box in CheckBox.boxes:
+        for box in boxes:
             box.select()
 
     def uncheck_all():
-        for box in CheckBox.boxes:
+        for box in boxes:
             box.var.set(False)
 
     sheets_to_keep = []
+    # set once the window is confirmed or closed, ends the wait below
+    done = BooleanVar(checkbox_popup, False)
 
     def confirm():
-        for box in CheckBox.boxes:
+        for box in boxes:
             if box.var.get():  # Checks if the button is ticked
                 sheets_to_keep.append(box.text)
 
         # makes button non-interactive until at least one option is selected
         if len(sheets_to_keep) > 0:
-            root.destroy()
+            done.set(True)
 
     check_all_button = Button(checkbox_popup,
                               text="Check all",
@@ -244,9 +373,14 @@ def checkbuttons_window(root: Tk) -> list[str]:
                             width=10)
     confirm_button.pack(pady=16)
 
+    # waits for the user input within the already running event loop
+    checkbox_popup.protocol("WM_DELETE_WINDOW", lambda: done.set(True))
+    checkbox_popup.wait_variable(done)
+    checkbox_popup.destroy()
+
     # 'X' closes this program
-    checkbox_popup.protocol("WM_DELETE_WINDOW", sys.exit)
-    checkbox_popup.mainloop()
+    if not sheets_to_keep:
+        sys.exit()
 
     return sheets_to_keep
 
@@ -302,7 +436,7 @@ def browse_verifika_profile(root: Tk, config_file: ConfigFile) -> str:
 
     # writes location to config if it does not exist
     if profiles_directory == "" or not isdir(profiles_directory):
-        profiles_directory = split(verifika_profile)[0]
+        profiles_directory = dirname(verifika_profile)
 
         update_config(config_file, "DEFAULT", "verifika_profiles_location",
                       profiles_directory)
@@ -310,29 +444,83 @@ def browse_verifika_profile(root: Tk, config_file: ConfigFile) -> str:
     return verifika_profile
 
 
+class _ProcessEntry(Structure):  # pylint: disable=too-few-public-methods
+    """PROCESSENTRY32W structure filled in by Process32FirstW/Process32NextW."""
+
+    _fields_ = [("dwSize", c_ulong), ("cntUsage", c_ulong),
+                ("th32ProcessID", c_ulong), ("th32DefaultHeapID", c_size_t),
+                ("th32ModuleID", c_ulong), ("cntThreads", c_ulong),
+                ("th32ParentProcessID", c_ulong), ("pcPriClassBase", c_long),
+                ("dwFlags", c_ulong), ("szExeFile", c_wchar * 260)]
+
+
+def _find_verifika_pids() -> list[int]:
+    """Returns PIDs of all running Verifika instances.
+    On Windows, a single snapshot of the process table is taken and its entries
+    already contain executable names, so no process has to be opened and queried.
+    Other platforms fall back to psutil."""
+
+    if sys.platform != "win32":
+        from psutil import process_iter  # pylint: disable=import-outside-toplevel
+
+        return [
+            process.pid for process in process_iter(attrs=["name"])
+            if process.info["name"] == "Verifika.exe"
+        ]
+
+    from ctypes import windll  # pylint: disable=import-outside-toplevel
+
+    kernel32 = windll.kernel32
+    kernel32.CreateToolhelp32Snapshot.restype = c_void_p
+
+    snapshot = kernel32.CreateToolhelp32Snapshot(_TH32CS_SNAPPROCESS, 0)
+    if snapshot in (None, _INVALID_HANDLE_VALUE):
+        return []
+
+    process_entry = _ProcessEntry()
+    process_entry.dwSize = sizeof(_ProcessEntry)
+
+    pids = []
+    try:
+        found = kernel32.Process32FirstW(c_void_p(snapshot),
+                                         byref(process_entry))
+        while found:
+            if process_entry.szExeFile.lower() == "verifika.exe":
+                pids.append(process_entry.th32ProcessID)
+
+            found = kernel32.Process32NextW(c_void_p(snapshot),
+                                            byref(process_entry))
+    finally:
+        kernel32.CloseHandle(c_void_p(snapshot))
+
+    return pids
+
+
 def close_verifika():
     """Checks if Verifika is already running and prompts user to close it."""
 
-    for process in process_iter(attrs=["name"]):
-        if process.name() == "Verifika.exe":
+    for pid in _find_verifika_pids():
+
+        answer = askyesno(
+            title="Verifika is already running",
+            message=("Another instance of Verifika is already running.\n"
+                     "Would you like to close it before continuing?\n"
+                     "Warning: no changes will be saved."),
+            icon="question")
 
-            answer = askyesno(
-                title="Verifika is already running",
-                message=("Another instance of Verifika is already running.\n"
-                         "Would you like to close it before continuing?\n"
-                         "Warning: no changes will be saved."),
-                icon="question")
+        # closes this program if user selects "no" (or closes the window)
+        if not answer:
+            sys.exit()
 
-            # closes this program if user selects "no" (or closes the window)
-            if not answer:
-                sys.exit()
+        # psutil is only imported when there is a process to kill
+        from psutil import Process, NoSuchProcess  # pylint: disable=import-outside-toplevel
 
-            try:
-                process.kill()
+        try:
+            Process(pid).kill()
 
-            # if user closes the program before selecting "yes"
-            except NoSuchProcess:
-                pass
+        # if user closes the program before selecting "yes"
+        except NoSuchProcess:
+            pass
 
 
 def select_files(root: Tk) -> tuple[tuple[str, ...], str]:
@@ -343,44 +531,50 @@ def select_files(root: Tk) -> tuple[tuple[str, ...], str]:
                              title="Choose a file",
                              filetypes=[("Any .xliff file", "*.*xliff")])
 
-    files_dir = split(files[0])[0]
-
     # program shuts down if no files have been selected
     if not files:
         sys.exit()
 
+    # dialog returns absolute paths, so the directory is a simple string operation
+    files_dir = dirname(files[0])
+
     return files, files_dir
 
 
-def manage_files(files: tuple[str]) -> str:
+def manage_files(files: tuple[str], files_dir: str,
+                 manual_optimization: bool) -> str:
     """Returns file(s) location and their path.\n
     Verifika's CMD implementation has an inbuilt limitation and
     cannot load in multiple files at once,
     this was circumvented by copying them to a subdirectory and loading it instead.
     Therefore this function returns either the file's or directory's path.\n
     Note: This is a separate function in order to make UI more responsive,
-    i.e., user can select all files and options before any intensive work is performed."""
+    i.e., user can select all files and options before any intensive work is performed.\n
+    files_dir is the directory returned by select_files.\n
+    Note: Multiple files are hardlinked when possible,
+    so edits saved to them would also change the originals.
+    With manual optimization the user may edit them in Verifika's UI,
+    therefore they are always copied and the originals are left untouched."""
 
-    # gets the directory where files are located
-    files_dir = split(files[0])[0]
-    temp_dir = f"{files_dir}/temp_dir"
+    temp_dir = join(files_dir, "temp_dir")
+
+    # removes directories left behind by background deletions that failed
+    _remove_pending_dirs(files_dir)
 
     if len(files) > 1:
         # removes sub-dir if it already exists
         if isdir(temp_dir):
-            rmtree(temp_dir)
+            _remove_flat_dir(temp_dir)
 
         # creates sub-dir and copies files to it
         mkdir(temp_dir)
-        source_dir = files_dir + "\\"
-        dst_sir = temp_dir + "\\"
 
-        for file in files:
-            # gets the name of the file
-            file_name = split(file)[1]
-            file_source_location = source_dir + file_name
-            file_dst_location = dst_sir + file_name
-            copy(file_source_location, file_dst_location)
+        # staging is I/O-bound, so files are linked or copied in parallel
+        # list() is used to raise any errors from the worker threads
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(
+                executor.map(_stage_file, files, repeat(temp_dir),
+                             repeat(manual_optimization)))
 
         files_to_check = temp_dir
 
@@ -391,106 +585,518 @@ def manage_files(files: tuple[str]) -> str:
     return files_to_check
 
 
-def run_qa(files_dir: str, verifika_exe_location: str, files_to_check: str,
-           verifika_profile: str, sheets_to_keep: list[str],
-           manual_optimization: bool):
-    """Preforms Verifika QA via CMD.\n
-    Returns QA report's name, if one was saved."""
+def _stage_file(file: str, temp_dir: str, copy_only: bool):
+    """Places the file into temp_dir for Verifika to check.
+    Hardlinks avoid copying the file's data when Verifika only reads the file.
+    Falls back to copying if linking is not possible (e.g., different drives).\n
+    copy_only is used when the staged files may be edited,
+    as edits to a hardlink change the original file as well."""
 
-    temp_report_name = f"{files_dir}/temp_report.xlsx"
+    # selected files already hold their full path
+    file_dst_location = join(temp_dir, basename(file))
 
-    # more optimized reports for individual Common, Consistency, and Spelling errors.
-    condition = ["Common Errors", "Consistency Errors", "Spelling Errors"]
-    if len(sheets_to_keep) == 1 and any(sheet in sheets_to_keep
-                                        for sheet in condition):
-        # takes just the first word
-        choice = sheets_to_keep[0]
-        report_type = choice.split(" ")[0]
-        cmd_command = (
-            f'"{verifika_exe_location}" -files "{files_to_check}" -profile "{verifika_profile}"'
-            f' -startcheck -type {report_type}')
+    if copy_only:
+        copyfile(file, file_dst_location)
+        return
 
-    # otherwise uses general Full report mode
+    try:
+        link(file, file_dst_location)
+    except OSError:
+        copyfile(file, file_dst_location)
+
+
+def _remove_flat_dir(directory: str):
+    """Deletes a directory which only contains files, such as temp_dir.
+    Its files are unlinked directly, without the recursive walk of shutil.rmtree.
+    If a subdirectory is found, rmtree is used instead."""
+
+    flat = True
+    with scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                flat = False
+                break
+            remove(entry.path)
+
+    # rmtree is called only after scandir's handle to the directory is closed
+    if flat:
+        rmdir(directory)
     else:
-        cmd_command = (
-            f'"{verifika_exe_location}" -files "{files_to_check}" -profile "{verifika_profile}"'
-            f' -startcheck -type Full')
+        rmtree(directory)
+
+
+def _remove_pending_dir(directory: str):
+    """Deletes a renamed temp_dir in the background.
+    Files may still be in use (e.g., a linked file opened in another program),
+    in which case whatever remains is deleted on the next run by manage_files."""
+
+    try:
+        _remove_flat_dir(directory)
+    except OSError:
+        pass
+
+
+def _remove_pending_dirs(files_dir: str):
+    """Deletes renamed temp_dirs left behind by previous runs, if there are any.
+    Directories that are still in use are skipped."""
+
+    with scandir(files_dir) as entries:
+        pending_dirs = [
+            entry.path for entry in entries
+            if entry.name.startswith(_PENDING_DELETE_PREFIX) and entry.is_dir(
+                follow_symlinks=False)
+        ]
+
+    for pending_dir in pending_dirs:
+        rmtree(pending_dir, ignore_errors=True)
+
+
+def generate_qa_command(verifika_exe_location: str, files_to_check: str,
+                        verifika_profile: str, sheets_to_keep: frozenset[str],
+                        temp_report_name: str,
+                        manual_optimization: bool) -> list[str]:
+    """Returns the Verifika command as a list of arguments.
+    Since no command string is built, paths do not need to be quoted or parsed again."""
+
+    # more optimized reports for individual Common, Consistency, and Spelling errors,
+    # otherwise uses general Full report mode
+    report_type = "Full"
+    if len(sheets_to_keep) == 1:
+        report_type = _REPORT_PRESETS.get(next(iter(sheets_to_keep)), "Full")
+
+    cmd_args = [
+        verifika_exe_location, "-files", files_to_check, "-profile",
+        verifika_profile, "-startcheck", "-type", report_type
+    ]
 
     # automatic optimization additionally requires path in order to store the report once created
     if not manual_optimization:
-        cmd_command += f' -result {temp_report_name}'
+        cmd_args.extend(["-result", temp_report_name])
+
+    return cmd_args
+
+
+def _run_verifika(cmd_args: list[str]):
+    """Runs Verifika and waits for it to finish.
+    On Windows no console window is created for it, while its own UI is still shown
+    (needed for manual optimization)."""
+
+    run(cmd_args,
+        stdout=DEVNULL,
+        stderr=DEVNULL,
+        check=False,
+        creationflags=_CREATE_NO_WINDOW if sys.platform == "win32" else 0)
+
+
+def run_qa(files_dir: str, verifika_exe_location: str, files_to_check: str,
+           verifika_profile: str, sheets_to_keep: list[str],
+           manual_optimization: bool):
+    """Preforms Verifika QA via CMD.\n
+    Returns QA report's name, if one was saved."""
+
+    temp_report_name = join(files_dir, "temp_report.xlsx")
+    # set allows constant-time lookups when filtering the report's sheets
+    keep_set = frozenset(sheets_to_keep)
+
+    cmd_args = generate_qa_command(verifika_exe_location, files_to_check,
+                                   verifika_profile, keep_set,
+                                   temp_report_name, manual_optimization)
 
     # runs QA via CMD with accompanying progress bar
-    # DEVNULL used to suppress the long output from Verifika, error output left enabled
-    with alive_bar(spinner=None,
-                   title="Performing QA check",
-                   stats=False,
-                   monitor=None,
-                   monitor_end='Performed in') as progress_bar:
-        with Popen(cmd_command, stdout=DEVNULL, stderr=STDOUT) as proc:
-            # waits for command line to finish QA
-            proc.wait()
+    # DEVNULL used to suppress the long output from Verifika
+    # progress bar is only shown in a terminal (stdout is None under pythonw)
+    if sys.stdout is not None and sys.stdout.isatty():
+        # imported here as it is not needed until QA starts, which speeds up startup
+        from alive_progress import alive_bar  # pylint: disable=import-outside-toplevel
+
+        with alive_bar(spinner=None,
+                       title="Performing QA check",
+                       stats=False,
+                       monitor=None,
+                       monitor_end='Performed in') as progress_bar:
+            # waits for Verifika to finish QA
+            _run_verifika(cmd_args)
             # stops progress bar and shows elapsed time
             progress_bar()  # pylint: disable=not-callable
 
+    else:
+        _run_verifika(cmd_args)
+
     # deletes temp-dir as it is no longer necessary
-    temp_dir = f"{files_dir}/temp_dir"
+    # it is renamed first, so it can be deleted in the background while the report is processed
+    temp_dir = join(files_dir, "temp_dir")
     if isdir(temp_dir):
-        rmtree(temp_dir)
+        pending_dir = join(files_dir, f"{_PENDING_DELETE_PREFIX}{getpid()}")
+        try:
+            rename(temp_dir, pending_dir)
+        except OSError:
+            _remove_flat_dir(temp_dir)
+        else:
+            # not a daemon thread, so the program waits for the deletion before exiting
+            Thread(target=_remove_pending_dir, args=(pending_dir, )).start()
 
     if not isfile(temp_report_name):
         if not manual_optimization:
             showinfo(title="No report saved", message="No errors were found.")
             sys.exit()
     else:
-        process_and_save_report(temp_report_name, sheets_to_keep)
+        process_and_save_report(temp_report_name, keep_set)
+
+
+def _read_report_sheets(archive: ZipFile) -> list[ReportSheet]:
+    """Returns the name, relationship ID, and part path of every sheet in the report,
+    in the order they appear in the workbook.\n
+    Returns an empty list if the workbook layout is not recognised
+    (e.g., a sheet without a matching relationship),
+    in which case the report must be kept as is."""
+
+    sheet_parts = {}
+    for relationship in ElementTree.fromstring(
+            archive.read(_WORKBOOK_RELS_PART)):
+        sheet_parts[relationship.get("Id")] = _resolve_part(
+            relationship.get("Target"))
+
+    workbook = ElementTree.fromstring(archive.read(_WORKBOOK_PART))
+
+    sheets = []
+    for sheet in workbook.iter(f"{_SPREADSHEET_NS}sheet"):
+        relationship_id = sheet.get(f"{_RELATIONSHIPS_NS}id")
+        if relationship_id not in sheet_parts:
+            return []
+
+        sheets.append(
+            (sheet.get("name"), relationship_id, sheet_parts[relationship_id]))
+
+    return sheets
+
+
+def _resolve_part(target: str, source_part: str = _WORKBOOK_PART) -> str:
+    """Returns the archive path of a part targeted by source_part's relationships.
+    Targets are either absolute or relative to source_part's directory."""
+
+    if target.startswith("/"):
+        return target[1:]
+
+    return posixpath.normpath(
+        posixpath.join(posixpath.dirname(source_part), target))
+
+
+def _get_rels_part(part: str) -> str:
+    """Returns the archive path of the part's relationships, e.g., a sheet's .rels."""
+
+    part_dir, part_file = posixpath.split(part)
+
+    return f"{part_dir}/_rels/{part_file}.rels"
+
 
+def _read_related_parts(archive: ZipFile, part: str) -> set[str]:
+    """Returns the archive paths of all internal parts the part has relationships with,
+    e.g., a sheet's comments, drawings, and tables."""
 
-def process_and_save_report(temp_report_name: str, sheets_to_keep: list[str]):
-    """Note: Sometimes Excel reports issues when opening these files,, however,
+    rels_part = _get_rels_part(part)
+    if rels_part not in archive.NameToInfo:
+        return set()
+
+    return {
+        _resolve_part(relationship.get("Target"), part)
+        for relationship in ElementTree.fromstring(archive.read(rels_part))
+        if relationship.get("TargetMode") != "External"
+    }
+
+
+def _has_error_rows(archive: ZipFile, sheet_part: str) -> bool:
+    """Checks whether a sheet has any rows below Verifika's 11-row header.
+    Rows are streamed and parsing stops at the first such row,
+    so the rest of the sheet is never read."""
+
+    row_number = 0
+    with archive.open(sheet_part) as sheet:
+        for _, element in iterparse(sheet):
+            if element.tag != f"{_SPREADSHEET_NS}row":
+                continue
+
+            # row numbers are optional, in which case rows follow one another
+            row_number = int(element.get("r", row_number + 1))
+            # rows without cells are not counted, same as empty rows in Excel
+            if row_number >= 12 and len(element) > 0:
+                return True
+
+            element.clear()
+
+    return False
+
+
+def _rewrite_xml_elements(xml: str, tag: str, rewrite: Callable) -> str:
+    """Replaces every <tag> element in the XML text with rewrite's return value.
+    Returning an empty string removes the element.
+    Works on the raw text, so the rest of the document stays exactly the same."""
+
+    pattern = re.compile(
+        rf"<(?:\w+:)?{tag}\b[^>]*?(?:/>|>.*?</(?:\w+:)?{tag}>)", re.DOTALL)
+
+    return pattern.sub(lambda match: rewrite(match.group()), xml)
+
+
+def _get_xml_attribute(element: str, attribute: str) -> Optional[str]:
+    """Returns the attribute's value from an element's raw XML text, if it has one.
+    Attribute can be a regular expression, e.g., to match any namespace prefix."""
+
+    match = re.search(rf"\s{attribute}\s*=\s*([\"'])(.*?)\1", element)
+
+    return match.group(2) if match else None
+
+
+def _set_xml_attribute(element: str, attribute: str, value: str) -> str:
+    """Sets the attribute's value in an element's raw XML text."""
+
+    return re.sub(rf"(\s{attribute}\s*=\s*)([\"']).*?\2",
+                  rf"\g<1>\g<2>{value}\g<2>",
+                  element,
+                  count=1)
+
+
+def _sheet_reference_pattern(sheet_name: str) -> str:
+    """Returns a regular expression matching references to the sheet in formulas,
+    e.g., 'Sheet 1'!$A$1 or Sheet1!$A$1."""
+
+    quoted_name = sheet_name.replace("'", "''")
+
+    return (rf"'{re.escape(quoted_name)}'!"
+            rf"|(?<![\w.']){re.escape(sheet_name)}!")
+
+
+def _write_pruned_report(temp_report_name: str, new_report_name: str,
+                         sheets: list[ReportSheet],
+                         sheets_to_remove: set[str]):
+    """Saves a copy of the report without the sheets that should be removed.
+    Report is treated as a ZIP archive: removed sheets' parts are left out
+    and only the workbook, its relationships, and content types are edited.
+    All other parts are copied as is, without loading the report into a workbook model.\n
+    Copy is written next to new_report_name first and then replaces it,
+    so the report is never truncated while it is still being read
+    (e.g., if the user saves over the temporary report)."""
+
+    # old sheet positions mapped to their new ones, used by sheet-specific names and views
+    new_positions = {}
+    dropped_ids = set()
+    dropped_parts = {_CALC_CHAIN_PART}
+    for position, sheet in enumerate(sheets):
+        sheet_name, relationship_id, sheet_part = sheet
+        if sheet_name in sheets_to_remove:
+            dropped_ids.add(relationship_id)
+            dropped_parts.update([sheet_part, _get_rels_part(sheet_part)])
+        else:
+            new_positions[str(position)] = str(len(new_positions))
+
+    # references to removed sheets, either quoted ('Sheet 1'!) or not (Sheet1!)
+    removed_sheet_reference = re.compile("|".join(
+        _sheet_reference_pattern(name) for name in sheets_to_remove))
+
+    def rewrite_sheet(element: str) -> str:
+        if _get_xml_attribute(element, r"\w+:id") in dropped_ids:
+            return ""
+        return element
+
+    # names specific to a removed sheet (e.g., filters) are removed as well
+    def rewrite_defined_name(element: str) -> str:
+        position = _get_xml_attribute(element, "localSheetId")
+        if position is None:
+            # global names are removed if they refer to a removed sheet
+            reference = unescape(re.sub(r"<[^>]*>", "", element), {
+                "&apos;": "'",
+                "&quot;": '"'
+            })
+            if removed_sheet_reference.search(reference):
+                return ""
+            return element
+        if position not in new_positions:
+            return ""
+        return _set_xml_attribute(element, "localSheetId",
+                                  new_positions[position])
+
+    # selected and first visible sheet fall back to the first one if removed
+    def rewrite_workbook_view(element: str) -> str:
+        for attribute in ("activeTab", "firstSheet"):
+            position = _get_xml_attribute(element, attribute)
+            if position is not None:
+                element = _set_xml_attribute(element, attribute,
+                                             new_positions.get(position, "0"))
+        return element
+
+    def rewrite_relationship(element: str) -> str:
+        if _resolve_part(_get_xml_attribute(element,
+                                            "Target")) in dropped_parts:
+            return ""
+        return element
+
+    def rewrite_override(element: str) -> str:
+        if _get_xml_attribute(element, "PartName")[1:] in dropped_parts:
+            return ""
+        return element
+
+    with ZipFile(temp_report_name) as source:
+        # parts of removed sheets (e.g., comments and tables) are removed as well,
+        # unless a remaining sheet also uses them
+        kept_parts = set()
+        for sheet_name, _, sheet_part in sheets:
+            related_parts = _read_related_parts(source, sheet_part)
+            if sheet_name in sheets_to_remove:
+                dropped_parts.update(related_parts)
+                dropped_parts.update(map(_get_rels_part, related_parts))
+            else:
+                kept_parts.update(related_parts)
+        dropped_parts -= kept_parts
+
+        workbook = source.read(_WORKBOOK_PART).decode("utf-8")
+        workbook = _rewrite_xml_elements(workbook, "sheet", rewrite_sheet)
+        workbook = _rewrite_xml_elements(workbook, "definedName",
+                                         rewrite_defined_name)
+        workbook = _rewrite_xml_elements(workbook, "workbookView",
+                                         rewrite_workbook_view)
+
+        workbook_rels = source.read(_WORKBOOK_RELS_PART).decode("utf-8")
+        workbook_rels = _rewrite_xml_elements(workbook_rels, "Relationship",
+                                              rewrite_relationship)
+
+        content_types = source.read(_CONTENT_TYPES_PART).decode("utf-8")
+        content_types = _rewrite_xml_elements(content_types, "Override",
+                                              rewrite_override)
+
+        rewritten_parts = {
+            _WORKBOOK_PART: workbook,
+            _WORKBOOK_RELS_PART: workbook_rels,
+            _CONTENT_TYPES_PART: content_types
+        }
+
+        pruned_report_name = join(dirname(new_report_name),
+                                  f".{basename(new_report_name)}.tmp")
+        try:
+            with ZipFile(pruned_report_name, "w", ZIP_DEFLATED) as target:
+                for item in source.infolist():
+                    if item.filename in dropped_parts:
+                        continue
+
+                    if item.filename in rewritten_parts:
+                        target.writestr(item.filename,
+                                        rewritten_parts[item.filename])
+                        continue
+
+                    with source.open(item) as source_part, target.open(
+                            item.filename, "w") as target_part:
+                        copyfileobj(source_part, target_part)
+
+        # partially written copy is not left behind
+        except BaseException:
+            if isfile(pruned_report_name):
+                remove(pruned_report_name)
+            raise
+
+    # source is closed first, as it may be the file that is replaced
+    try:
+        replace(pruned_report_name, new_report_name)
+    except OSError:
+        remove(pruned_report_name)
+        raise
+
+
+def process_and_save_report(temp_report_name: str,
+                            sheets_to_keep: frozenset[str]):
+    """Removes sheets that are not needed from the report and saves it.
+    Report is never loaded into a workbook model,
+    only the rows needed to decide which sheets to keep are read.\n
+    Note: Sometimes Excel reports issues when opening these files,, however,
     they can be fixed."""
 
-    files_dir = split(temp_report_name)[0]
-    wb_verifika = load_workbook(temp_report_name, read_only=False)
-    remove(temp_report_name)
-
-    for sheet_name in wb_verifika.sheetnames:
-        sheet = wb_verifika[sheet_name]
-        # removes sheets that are just Verifika sheet headers
-        if sheet.max_row < 12:
-            wb_verifika.remove(sheet)
-        # further optimization for non-Full reports
-        elif "Full" not in sheets_to_keep and sheet_name not in sheets_to_keep:
-            wb_verifika.remove(sheet)
-
-    if len(wb_verifika.sheetnames) > 0:
-        report_saved = False
-        while not report_saved:
-            try:
-                new_report_name = asksaveasfilename(initialdir=files_dir,
-                                                    initialfile="QA report",
-                                                    defaultextension=".xlsx",
-                                                    filetypes=[
-                                                        ("Excel file (.xlsx)",
-                                                         "*.xlsx")
-                                                    ])
-
-                if not new_report_name:
-                    sys.exit()
-
-                report_saved = True
-            except PermissionError:
-                showerror(
-                    title="Error occurred!",
-                    message=
-                    ("File could not be saved because it is already opened "
-                     "by another process (most likely Excel or another reader). "
-                     "Please close it before continuing."))
-
-        wb_verifika.save(new_report_name)
-
-        # opens saved report
-        system(f'"{new_report_name}"')
+    files_dir = dirname(temp_report_name)
+
+    sheets_to_remove = set()
+    with ZipFile(temp_report_name) as archive:
+        sheets = _read_report_sheets(archive)
+
+        for sheet_name, _, sheet_part in sheets:
+            # further optimization for non-Full reports, no need to read these sheets
+            if "Full" not in sheets_to_keep and sheet_name not in sheets_to_keep:
+                sheets_to_remove.add(sheet_name)
+
+            # removes sheets that are just Verifika sheet headers
+            elif not _has_error_rows(archive, sheet_part):
+                sheets_to_remove.add(sheet_name)
+
+    # an unrecognised report is saved unmodified, it never counts as error-free
+    if sheets and len(sheets_to_remove) == len(sheets):
+        remove(temp_report_name)
+        showinfo(title="No report saved", message="No errors were found.")
+        return
+
+    report_saved = False
+    while not report_saved:
+        new_report_name = asksaveasfilename(initialdir=files_dir,
+                                            initialfile="QA report",
+                                            defaultextension=".xlsx",
+                                            filetypes=[("Excel file (.xlsx)",
+                                                        "*.xlsx")])
+
+        if not new_report_name:
+            remove(temp_report_name)
+            sys.exit()
+
+        try:
+            # if no sheets were dropped the report is moved as is
+            if sheets_to_remove:
+                _write_pruned_report(temp_report_name, new_report_name, sheets,
+                                     sheets_to_remove)
+                # temporary report may have been saved over by the user
+                if abspath(new_report_name) != abspath(temp_report_name):
+                    remove(temp_report_name)
+            else:
+                move_report(temp_report_name, new_report_name)
+
+            report_saved = True
+        except PermissionError:
+            showerror(
+                title="Error occurred!",
+                message=(
+                    "File could not be saved because it is already opened "
+                    "by another process (most likely Excel or another reader). "
+                    "Please close it before continuing."))
+
+    open_report(new_report_name)
+
+
+def open_report(report_name: str):
+    """Opens the report in its default program without spawning a shell.
+    Does not wait for the program to close."""
+
+    if sys.platform == "win32":
+        # only available on Windows
+        from os import startfile  # pylint: disable=import-outside-toplevel,no-name-in-module
+        startfile(report_name)
+
+    else:
+        opener = "open" if sys.platform == "darwin" else "xdg-open"
+        # new session lets the program outlive this one
+        Popen(  # pylint: disable=consider-using-with
+            [opener, report_name],
+            stdout=DEVNULL,
+            stderr=DEVNULL,
+            start_new_session=True)
+
+
+def move_report(temp_report_name: str, new_report_name: str):
+    """Moves the report to its new location by renaming it,
+    which avoids reading and writing the whole file.
+    Falls back to copying if the new location is on another drive."""
+
+    try:
+        replace(temp_report_name, new_report_name)
+
+    # report is still opened by another process, handled by the caller
+    except PermissionError:
+        raise
+
+    except OSError:
+        copyfile(temp_report_name, new_report_name)
+        remove(temp_report_name)
 
 
 def main():
@@ -508,7 +1114,11 @@ def main():
 
     sheets_to_keep, manual_optimization = select_report_type(root)
 
-    files_to_check = manage_files(files)
+    # saves browsed locations before the long QA run,
+    # as closing the console window skips the flush registered for exit
+    config_file.flush()
+
+    files_to_check = manage_files(files, files_dir, manual_optimization)
 
     run_qa(files_dir, verifika_exe_location, files_to_check, verifika_profile,
            sheets_to_keep, manual_optimization)